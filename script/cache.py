@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .job import ReportJob
+from .reader import dataset_fingerprint
+
+
+def make_cache_key(report_name: str, file_paths: List[str],
+                   options: Optional[Dict[str, Any]] = None) -> str:
+    """Ключ кэша: отпечаток файлов + название отчета + его параметры."""
+    payload = {
+        'report': report_name,
+        'options': options or {},
+        'files': dataset_fingerprint(file_paths),
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ReportCache:
+    """LRU-кэш результатов отчетов с TTL и необязательным хранением на диске."""
+
+    def __init__(self, max_entries: int = 128, ttl: Optional[float] = None,
+                 cache_dir: Optional[str] = None):
+        if max_entries < 1:
+            raise ValueError("Размер кэша должен быть положительным")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Возвращает сохраненный результат или None, если его нет или он устарел."""
+        entry = self._entries.get(key)
+        if entry is None and self.cache_dir is not None:
+            entry = self._load_from_disk(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None:
+            return None
+
+        created_at, value = entry
+        if self._is_expired(created_at):
+            self.invalidate(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        entry = (time.time(), value)
+        self._remember(key, entry)
+        if self.cache_dir is not None:
+            self._save_to_disk(key, entry)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self.cache_dir is not None:
+            self._entry_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob('*.json'):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, entry: Tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        # Вытесняем давно не использованные записи
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load_from_disk(self, key: str) -> Optional[Tuple[float, Any]]:
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                payload = json.load(file)
+            # Данные отчетов — списки кортежей; JSON возвращает их списками
+            entry = (float(payload['created_at']),
+                     [tuple(row) for row in payload['value']])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            # Поврежденную запись просто выбрасываем
+            path.unlink(missing_ok=True)
+            return None
+
+        # Обновляем время доступа для LRU-очистки каталога
+        os.utime(path)
+        return entry
+
+    def _save_to_disk(self, key: str, entry: Tuple[float, Any]) -> None:
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix('.tmp')
+        created_at, value = entry
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'created_at': created_at, 'value': value}, file, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        # Ограничиваем размер каталога, удаляя самые старые записи
+        files = sorted(self.cache_dir.glob('*.json'),
+                       key=lambda p: p.stat().st_mtime_ns)
+        for old_path in files[:max(0, len(files) - self.max_entries)]:
+            old_path.unlink(missing_ok=True)
+
+
+# Кэш процесса, используемый по умолчанию
+default_cache = ReportCache()
+
+
+def cached_generate(report_name: str, file_paths: List[str],
+                    cache: Optional[ReportCache] = None,
+                    options: Optional[Dict[str, Any]] = None) -> Any:
+    """Генерирует отчет, не перечитывая CSV при повторном запросе.
+
+    Параметры ``options`` описаны в ReportJob.
+    """
+    if cache is None:
+        cache = default_cache
+
+    job = ReportJob(report_name, file_paths, options)
+    if not job.deterministic:
+        # Выборка без seed при каждом запуске своя: результат из кэша
+        # закрепил бы одну случайную выборку на все время жизни записи
+        return job.generate(job.read())
+
+    key = make_cache_key(report_name, file_paths, job.options)
+    report_data = cache.get(key)
+    if report_data is None:
+        report_data = job.generate(job.read())
+        cache.set(key, report_data)
+    return report_data
@@ -1,13 +1,115 @@
 import argparse
+import sqlite3
 import sys
 from pathlib import Path
 from .reports import get_report_generator
-from .reader import read_csv_files
+from .cache import ReportCache, make_cache_key
+from .job import ReportJob
+from .storage import SQLiteStore
+from .partial import merge_partials, write_partial
+from .filters import FilterError
+
+
+def check_files(file_paths):
+    missing_files = []
+    for file_path in file_paths:
+        if not Path(file_path).exists():
+            missing_files.append(file_path)
+
+    if missing_files:
+        print(f"Ошибка: следующие файлы не найдены:", file=sys.stderr)
+        for f in missing_files:
+            print(f"  - {f}", file=sys.stderr)
+        sys.exit(1)
+
+
+def partial_main(argv):
+    """dev partial: частичная агрегация локальных файлов в файл состояния."""
+    parser = argparse.ArgumentParser(
+        description="Частичная агрегация отчета для последующего объединения",
+        prog="dev-analytics partial"
+    )
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        required=True,
+        help="Пути к CSV файлам с данными",
+    )
+    parser.add_argument(
+        "--report",
+        required=True,
+        help="Название отчета (performance)",
+    )
+    parser.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        help="Фильтр строк, например 'team=API Team' (можно указать несколько раз)",
+    )
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Путь к файлу состояния",
+    )
+    parser.add_argument(
+        "--rank",
+        type=int,
+        default=0,
+        help="Порядковый номер узла: задает место его файлов среди файлов всех "
+             "узлов, как в списке --files при запуске на одной машине",
+    )
+
+    args = parser.parse_args(argv)
+    check_files(args.files)
+
+    try:
+        job = ReportJob(args.report, args.files, {'where': args.where})
+        state = job.report.accumulate(job.read(), rank=args.rank)
+        # Сохраняем фильтры в нормализованном виде, чтобы merge мог их сравнить
+        where = [repr(row_filter) for row_filter in job.filters]
+        write_partial(args.output, args.report, state, where)
+    except (ValueError, OSError) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def merge_main(argv):
+    """dev merge: объединение файлов состояний и вывод итогового отчета."""
+    parser = argparse.ArgumentParser(
+        description="Объединение частичных состояний и вывод отчета",
+        prog="dev-analytics merge"
+    )
+    parser.add_argument(
+        "states",
+        nargs="+",
+        help="Файлы состояний, созданные командой partial",
+    )
+
+    args = parser.parse_args(argv)
+    check_files(args.states)
+
+    try:
+        report_name, state = merge_partials(args.states)
+        report_generator = get_report_generator(report_name)
+        report_generator.display(report_generator.finalize(state))
+    except ValueError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
+    except (OSError, KeyError, TypeError) as e:
+        print(f"Ошибка в файле состояния: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 def main():
+    argv = sys.argv[1:]
+    if argv and argv[0] == "partial":
+        return partial_main(argv[1:])
+    if argv and argv[0] == "merge":
+        return merge_main(argv[1:])
+
     parser = argparse.ArgumentParser(
-        description="Анализ эффективности работы разработчиков",
+        description="Анализ эффективности работы разработчиков. "
+                    "Для распределенного запуска: dev partial / dev merge",
         prog="dev-analytics"
     )
     parser.add_argument(
@@ -21,24 +123,122 @@ def main():
         required=True,
         help="Название отчета (performance)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Каталог для сохранения результатов отчетов между запусками",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help="Время жизни записи кэша в секундах",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=128,
+        help="Максимальное количество записей в кэше",
+    )
+    parser.add_argument(
+        "--db",
+        help="Путь к SQLite базе для повторного использования загруженных данных",
+    )
+    parser.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        help="Фильтр строк, например 'team=API Team' или 'experience_years>=5' "
+             "(можно указать несколько раз)",
+    )
+    sample_group = parser.add_mutually_exclusive_group()
+    sample_group.add_argument(
+        "--sample",
+        type=float,
+        metavar="FRACTION",
+        help="Приблизительный отчет по случайной доле строк (например 0.01)",
+    )
+    sample_group.add_argument(
+        "--sample-rows",
+        type=int,
+        metavar="N",
+        help="Приблизительный отчет по равномерной выборке из N строк",
+    )
+    parser.add_argument(
+        "--sample-blocks",
+        action="store_true",
+        help="Для --sample: читать случайные блоки больших файлов вместо всех строк",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Начальное значение генератора случайных чисел для выборки",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Уровень доверия интервалов для отчета по выборке",
+    )
 
     args = parser.parse_args()
 
     # Проверка файлов
-    missing_files = []
-    for file_path in args.files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    check_files(args.files)
 
-    if missing_files:
-        print(f"Ошибка: следующие файлы не найдены:", file=sys.stderr)
-        for f in missing_files:
-            print(f"  - {f}", file=sys.stderr)
+    options = {
+        'where': args.where,
+        'sample': args.sample,
+        'sample_rows': args.sample_rows,
+        'sample_blocks': args.sample_blocks,
+        'seed': args.seed,
+        'confidence': args.confidence,
+    }
+    try:
+        job = ReportJob(args.report, args.files, options)
+        if job.sampler is not None and args.db:
+            raise ValueError("Выборка не поддерживается вместе с --db")
+    except ValueError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
         sys.exit(1)
+    except Exception as e:
+        print(f"Ошибка при генерации отчета: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Поиск готового результата в кэше; выборка без seed не кэшируется
+    cache = None
+    cache_key = None
+    if args.cache_dir and job.deterministic:
+        try:
+            cache = ReportCache(max_entries=args.cache_size, ttl=args.cache_ttl,
+                                cache_dir=args.cache_dir)
+        except (OSError, ValueError) as e:
+            print(f"Ошибка кэша: {e}", file=sys.stderr)
+            sys.exit(1)
+        cache_key = make_cache_key(args.report, args.files, job.options)
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            try:
+                job.report.display(cached_data)
+            except Exception as e:
+                print(f"Ошибка при генерации отчета: {e}", file=sys.stderr)
+                sys.exit(1)
+            return
 
     # Чтение данных
+    store = None
+    data = None
     try:
-        data = read_csv_files(args.files)
+        if args.db:
+            store = SQLiteStore(args.db)
+            store.load(args.files)
+        else:
+            data = job.read()
+    except sqlite3.Error as e:
+        print(f"Ошибка базы данных: {e}", file=sys.stderr)
+        sys.exit(1)
+    except FilterError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
     except FileNotFoundError as e:
         print(f"Ошибка: {e}", file=sys.stderr)
         sys.exit(1)
@@ -51,15 +251,22 @@ def main():
 
     # Генерация отчета
     try:
-        report_generator = get_report_generator(args.report)
-        report_data = report_generator.generate(data)
-        report_generator.display(report_data)
+        if store is not None:
+            report_data = job.generate_from_store(store)
+        else:
+            report_data = job.generate(data)
+        if cache is not None:
+            cache.set(cache_key, report_data)
+        job.report.display(report_data)
     except ValueError as e:
         print(f"Ошибка: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"Ошибка при генерации отчета: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
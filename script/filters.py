@@ -0,0 +1,121 @@
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Числовые столбцы и функции их преобразования
+NUMERIC_COLUMNS: Dict[str, Callable[[str], Any]] = {
+    'completed_tasks': int,
+    'performance': float,
+    'experience_years': int,
+}
+
+# Столбцы с небольшим числом уникальных значений, хранящиеся в словаре
+CATEGORICAL_COLUMNS = ('position', 'team')
+
+# Операторы сравнения; их обозначения совпадают с операторами SQLite
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '=': operator.eq,
+}
+
+
+class FilterError(ValueError):
+    """Ошибка в условии фильтра, а не в данных."""
+
+
+class CategoryDictionary:
+    """Словарное кодирование значений: строка -> целочисленный код."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def encode(self, raw: str) -> int:
+        code = self.codes.get(raw)
+        if code is None:
+            code = len(self.values)
+            self.codes[raw] = code
+            self.values.append(raw)
+        return code
+
+
+class RowFilter:
+    """Условие вида ``столбец оператор значение`` над сырыми строками CSV."""
+
+    def __init__(self, column: str, operator_symbol: str, value: str):
+        if operator_symbol not in _OPERATORS:
+            raise FilterError(f"Неизвестный оператор фильтра: {operator_symbol}")
+
+        self.column = column
+        self.operator_symbol = operator_symbol
+        self.value = value
+        self._compare = _OPERATORS[operator_symbol]
+        self._convert = NUMERIC_COLUMNS.get(column)
+
+        if self._convert is not None:
+            try:
+                self._target = self._convert(value)
+            except ValueError:
+                raise FilterError(
+                    f"Неверное значение фильтра для столбца {column}: {value}"
+                )
+        else:
+            self._target = value
+
+    def matches(self, raw: str) -> bool:
+        """Проверяет сырое значение; числа преобразуются только для этого столбца."""
+        if self._convert is not None:
+            return self._compare(self._convert(raw), self._target)
+        return self._compare(raw, self._target)
+
+    def bind(self, dictionary: CategoryDictionary) -> Callable[[int], bool]:
+        """Возвращает проверку по коду словаря.
+
+        Предикат вычисляется один раз на каждое уникальное значение,
+        дальше отклонение строки стоит одного обращения к списку.
+        """
+        verdicts: List[bool] = []
+
+        def matches_code(code: int) -> bool:
+            while len(verdicts) <= code:
+                verdicts.append(self.matches(dictionary.values[len(verdicts)]))
+            return verdicts[code]
+
+        return matches_code
+
+    def to_sql(self) -> Tuple[str, Any]:
+        """Условие WHERE и его параметр для SQLite-хранилища."""
+        return f"d.{self.column} {self.operator_symbol} ?", self._target
+
+    def __repr__(self) -> str:
+        return f"{self.column}{self.operator_symbol}{self.value}"
+
+
+def parse_filter(expression: str) -> RowFilter:
+    """Разбирает выражение вида ``team=API Team`` или ``experience_years>=5``."""
+    for index, char in enumerate(expression):
+        if char not in '<>!=':
+            continue
+        symbol = expression[index:index + 2]
+        if symbol not in _OPERATORS:
+            symbol = char
+        column = expression[:index].strip()
+        if symbol in _OPERATORS and column:
+            return RowFilter(column, symbol, expression[index + len(symbol):].strip())
+        break
+    raise FilterError(f"Неверный формат фильтра: {expression}")
+
+
+def parse_filters(expressions: Optional[List[str]]) -> List[RowFilter]:
+    return [parse_filter(expression) for expression in expressions or []]
+
+
+def check_filter_columns(filters: List[RowFilter], columns: Iterable[str]) -> None:
+    """Проверяет, что все столбцы фильтров есть среди доступных."""
+    available = set(columns)
+    for row_filter in filters:
+        if row_filter.column not in available:
+            raise FilterError(f"Неизвестный столбец фильтра: {row_filter.column}")
@@ -0,0 +1,48 @@
+from typing import Any, Dict, List, Optional
+
+from .filters import parse_filters
+from .reader import read_csv_files
+from .reports import get_report_generator
+from .sampling import make_sampler
+
+
+class ReportJob:
+    """Один запрос отчета: разбор параметров, чтение данных и генерация.
+
+    Поддерживаемые параметры: ``where`` — список выражений фильтров;
+    ``sample``, ``sample_rows``, ``sample_blocks``, ``seed`` — выборка строк;
+    ``confidence`` — уровень доверия интервалов для отчета по выборке.
+    """
+
+    def __init__(self, report_name: str, file_paths: List[str],
+                 options: Optional[Dict[str, Any]] = None):
+        self.report_name = report_name
+        self.file_paths = file_paths
+        self.options = options or {}
+
+        self.filters = parse_filters(self.options.get('where'))
+        self.sampler = make_sampler(
+            self.options.get('sample'), self.options.get('sample_rows'),
+            self.options.get('sample_blocks', False), self.options.get('seed'),
+        )
+        report_options = {}
+        if self.sampler is not None:
+            report_options['confidence'] = self.options.get('confidence', 0.95)
+            report_options['clustered'] = bool(self.options.get('sample_blocks'))
+        # Отчет создается до чтения, чтобы читать только нужные ему столбцы
+        self.report = get_report_generator(report_name, **report_options)
+
+    @property
+    def deterministic(self) -> bool:
+        """Повторный запуск дает тот же результат (нет выборки без seed)."""
+        return self.sampler is None or self.options.get('seed') is not None
+
+    def read(self) -> List[Dict[str, Any]]:
+        return read_csv_files(self.file_paths, self.filters, self.report.columns,
+                              self.sampler)
+
+    def generate(self, data: List[Dict[str, Any]]) -> Any:
+        return self.report.generate(data)
+
+    def generate_from_store(self, store) -> Any:
+        return self.report.generate_from_store(store, self.file_paths, self.filters)
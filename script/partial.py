@@ -0,0 +1,70 @@
+import json
+import os
+from functools import reduce
+from typing import Any, Dict, List, Optional, Tuple
+
+from .reports import get_report_generator
+
+# Формат файла частичного состояния; версия увеличивается при несовместимых изменениях
+PARTIAL_FORMAT = 'dev-analytics-partial'
+PARTIAL_VERSION = 2
+
+
+def write_partial(path: str, report_name: str, state: Dict[str, Any],
+                  where: Optional[List[str]] = None) -> None:
+    """Сохраняет частичное состояние отчета в JSON.
+
+    ``where`` — фильтры, с которыми построено состояние; объединять можно
+    только состояния с одинаковыми фильтрами.
+    """
+    payload = {
+        'format': PARTIAL_FORMAT,
+        'version': PARTIAL_VERSION,
+        'report': report_name,
+        'where': sorted(where or []),
+        'state': state,
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(payload, file, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def read_partial(path: str) -> Tuple[str, List[str], Dict[str, Any]]:
+    """Читает частичное состояние: название отчета, фильтры и состояние."""
+    with open(path, 'r', encoding='utf-8') as file:
+        try:
+            payload = json.load(file)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Файл {path} не является файлом состояния: {e}")
+
+    if not isinstance(payload, dict) or payload.get('format') != PARTIAL_FORMAT:
+        raise ValueError(f"Файл {path} не является файлом состояния")
+    if payload.get('version') != PARTIAL_VERSION:
+        raise ValueError(
+            f"Неподдерживаемая версия файла состояния {path}: {payload.get('version')}"
+        )
+    return payload['report'], payload['where'], payload['state']
+
+
+def merge_partials(paths: List[str]) -> Tuple[str, Dict[str, Any]]:
+    """Объединяет файлы состояний одного отчета."""
+    partials = [read_partial(path) for path in paths]
+
+    report_names = {report_name for report_name, _, _ in partials}
+    if len(report_names) != 1:
+        raise ValueError(
+            f"Файлы состояний относятся к разным отчетам: {', '.join(sorted(report_names))}"
+        )
+
+    filter_sets = {tuple(where) for _, where, _ in partials}
+    if len(filter_sets) != 1:
+        raise ValueError(
+            "Файлы состояний построены с разными фильтрами: "
+            + '; '.join(', '.join(where) or 'без фильтров' for where in sorted(filter_sets))
+        )
+
+    report_name = report_names.pop()
+    report = get_report_generator(report_name)
+    state = reduce(report.merge_states, (state for _, _, state in partials))
+    return report_name, state
@@ -1,4 +1,6 @@
-from typing import List, Dict, Any
+import math
+from statistics import stdev
+from typing import List, Dict, Any, Tuple
 from collections import defaultdict
 
 
@@ -11,4 +13,79 @@ def group_by_position(data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, An
 def calculate_average_performance(developers: List[Dict[str, Any]]) -> float:
     if not developers:
         return 0.0
-    return sum(dev['performance'] for dev in developers) / len(developers)
\ No newline at end of file
+    # fsum округляет точную сумму один раз, поэтому результат не зависит
+    # от порядка строк и совпадает с объединением частичных сумм
+    return math.fsum(dev['performance'] for dev in developers) / len(developers)
+
+def _continued_beta(a: float, b: float, x: float) -> float:
+    # Цепная дробь для неполной бета-функции (метод Лентца)
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 300):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= d * c
+        if abs(d * c - 1.0) < 1e-15:
+            break
+    return result
+
+
+def _regularized_beta(a: float, b: float, x: float) -> float:
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _continued_beta(a, b, x) / a
+    return 1.0 - front * _continued_beta(b, a, 1.0 - x) / b
+
+
+def student_t_quantile(probability: float, df: int) -> float:
+    """Квантиль распределения Стьюдента с ``df`` степенями свободы."""
+    if not 0.5 <= probability < 1:
+        raise ValueError("Вероятность должна быть в диапазоне [0.5, 1)")
+
+    def upper_tail(t: float) -> float:
+        return 0.5 * _regularized_beta(df / 2.0, 0.5, df / (df + t * t))
+
+    target = 1.0 - probability
+    low, high = 0.0, 1.0
+    while upper_tail(high) > target:
+        low, high = high, high * 2
+    # Хвост монотонно убывает, поэтому достаточно деления отрезка пополам
+    for _ in range(200):
+        middle = (low + high) / 2
+        if upper_tail(middle) > target:
+            low = middle
+        else:
+            high = middle
+        if high - low < 1e-12 * high:
+            break
+    return (low + high) / 2
+
+
+def calculate_performance_interval(developers: List[Dict[str, Any]],
+                                   confidence: float = 0.95) -> Tuple[float, float, int]:
+    """Среднее, полуширина доверительного интервала и размер выборки.
+
+    Для малых групп используется распределение Стьюдента, а не нормальное.
+    """
+    count = len(developers)
+    mean = calculate_average_performance(developers)
+    if count < 2:
+        return mean, math.nan, count
+
+    t = student_t_quantile((1 + confidence) / 2, count - 1)
+    deviation = stdev(dev['performance'] for dev in developers)
+    return mean, t * deviation / math.sqrt(count), count
@@ -1,5 +1,23 @@
 import csv
-from typing import List, Dict, Any
+import os
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from .filters import (
+    CATEGORICAL_COLUMNS, NUMERIC_COLUMNS, CategoryDictionary, RowFilter,
+    check_filter_columns,
+)
+from .sampling import Sampler
+
+
+def dataset_fingerprint(file_paths: List[str]) -> List[Tuple[str, int, int, int]]:
+    """Отпечаток входных файлов без чтения их содержимого."""
+    fingerprint = []
+    for file_path in file_paths:
+        stat = os.stat(file_path)
+        fingerprint.append(
+            (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        )
+    return fingerprint
 
 
 def detect_delimiter(file_path: str) -> str:
@@ -21,28 +39,97 @@ def detect_delimiter(file_path: str) -> str:
             return ','
 
 
-def read_csv_files(file_paths: List[str]) -> List[Dict[str, Any]]:
+def read_csv_files(file_paths: List[str],
+                   filters: Optional[List[RowFilter]] = None,
+                   columns: Optional[Sequence[str]] = None,
+                   sampler: Optional[Sampler] = None) -> List[Dict[str, Any]]:
+    """Читает CSV файлы в список записей.
+
+    Если задан ``columns``, в записи попадают только эти столбцы и только
+    они преобразуются в числа; остальные поля отбрасываются сразу после
+    разбора строки. Если задан ``sampler``, возвращается выборка строк,
+    прошедших фильтры; записи строятся только для попавших в нее строк.
+    """
     all_data: List[Dict[str, Any]] = []
+    filters = filters or []
+    # Словари значений общие для всех файлов: одинаковые строки хранятся один раз
+    dictionaries = {column: CategoryDictionary() for column in CATEGORICAL_COLUMNS}
 
     for file_path in file_paths:
         delimiter = detect_delimiter(file_path)
 
         with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file, delimiter=delimiter)
+            lines = sampler.lines(file) if sampler is not None else file
+            reader = csv.reader(lines, delimiter=delimiter)
+            header = next(reader, None)
+            if header is None:
+                continue
+            width = len(header)
+            # Ошибка в фильтре не должна выглядеть как ошибка в данных
+            check_filter_columns(filters, header)
 
             try:
+                index = {column: i for i, column in enumerate(header)}
+                if columns is None:
+                    selected_columns = header
+                    required = list(NUMERIC_COLUMNS)
+                else:
+                    selected_columns = columns
+                    required = list(columns)
+                missing = [column for column in required if column not in index]
+                if missing:
+                    raise KeyError(missing[0])
+                selected = [(column, index[column], NUMERIC_COLUMNS.get(column))
+                            for column in selected_columns]
+
+                # Кодируем только столбцы, которые попадут в запись или нужны фильтрам
+                used = set(selected_columns) | {f.column for f in filters}
+                categorical = [(index[column], dictionaries[column])
+                               for column in CATEGORICAL_COLUMNS
+                               if column in index and column in used]
+                positions = {i: position for position, (i, _) in enumerate(categorical)}
+                code_checks = [(positions[index[f.column]], f.bind(dictionaries[f.column]))
+                               for f in filters if f.column in CATEGORICAL_COLUMNS]
+                raw_checks = [(index[f.column], f)
+                              for f in filters if f.column not in CATEGORICAL_COLUMNS]
+
                 for row in reader:
-                    row_dict = dict(row)
-                    # Преобразуем числовые поля
-                    row_dict['completed_tasks'] = int(row_dict['completed_tasks'])
-                    row_dict['performance'] = float(row_dict['performance'])
-                    row_dict['experience_years'] = int(row_dict['experience_years'])
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row = row + [None] * (width - len(row))
+
+                    # Фильтры проверяются до преобразования типов и создания записи;
+                    # для должности и команды сравниваются коды словаря, а не строки
+                    codes = [dictionary.encode(row[i]) for i, dictionary in categorical]
+                    if not all(check(codes[position]) for position, check in code_checks):
+                        continue
+                    if not all(f.matches(row[i]) for i, f in raw_checks):
+                        continue
+
+                    slot = len(all_data)
+                    if sampler is not None:
+                        slot = sampler.slot(slot)
+                        if slot is None:
+                            continue
+
+                    # Одинаковые значения ссылаются на одну строку из словаря
+                    for (i, dictionary), code in zip(categorical, codes):
+                        row[i] = dictionary.values[code]
+
+                    # Берем только нужные столбцы и преобразуем числовые поля
+                    row_dict = {}
+                    for column, i, convert in selected:
+                        row_dict[column] = convert(row[i]) if convert else row[i]
 
-                    all_data.append(row_dict)
+                    if slot == len(all_data):
+                        all_data.append(row_dict)
+                    else:
+                        all_data[slot] = row_dict
 
-            except (ValueError, KeyError) as e:
+            except (ValueError, KeyError, TypeError) as e:
                 raise ValueError(
                     f"Неверный формат данных в файле {file_path}: {e}"
                 )
 
-    return all_data
\ No newline at end of file
+    return all_data
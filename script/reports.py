@@ -1,10 +1,16 @@
+import math
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple
-from .processors import group_by_position, calculate_average_performance
+from fractions import Fraction
+from typing import List, Dict, Any, Optional, Tuple
+from .processors import (
+    group_by_position, calculate_average_performance, calculate_performance_interval
+)
 
 
 # Абстрактный базовый класс для отчетов
 class Report(ABC):
+    # Столбцы, необходимые отчету; None — все столбцы файла
+    columns: Optional[Tuple[str, ...]] = None
 
     @abstractmethod
     def generate(self, data: List[Dict[str, Any]]) -> List[Tuple[str, Any]]:
@@ -16,22 +22,122 @@ class Report(ABC):
         """Отображает отчет в консоли."""
         pass
 
+    def generate_from_store(self, store, file_paths: List[str],
+                            filters: Optional[list] = None) -> List[Tuple[str, Any]]:
+        """Генерирует отчет по данным из SQLite-хранилища."""
+        return self.generate(store.fetch_all(file_paths, filters, self.columns))
+
+    # Частичная агрегация для распределенного запуска (dev partial / dev merge).
+    # Состояние должно сериализоваться в JSON, а merge_states — быть
+    # ассоциативной и коммутативной.
+    def accumulate(self, data: List[Dict[str, Any]], rank: int = 0) -> Dict[str, Any]:
+        """Вычисляет частичное состояние отчета по части данных.
+
+        ``rank`` — порядковый номер части среди всех частей данных.
+        """
+        raise ValueError(
+            f"Отчет {type(self).__name__} не поддерживает частичную агрегацию"
+        )
+
+    def merge_states(self, left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+        """Объединяет два частичных состояния."""
+        raise ValueError(
+            f"Отчет {type(self).__name__} не поддерживает частичную агрегацию"
+        )
+
+    def finalize(self, state: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """Строит данные отчета из объединенного состояния."""
+        raise ValueError(
+            f"Отчет {type(self).__name__} не поддерживает частичную агрегацию"
+        )
+
 
 class PerformanceReport(Report):
+    columns = ('position', 'performance')
+
+    def __init__(self, confidence: Optional[float] = None, clustered: bool = False):
+        # Для отчета по выборке: уровень доверия интервала для среднего.
+        # clustered — строки выбраны блоками и не независимы, поэтому
+        # интервал по формуле для независимой выборки не строится
+        if confidence is not None and not 0 < confidence < 1:
+            raise ValueError("Уровень доверия должен быть в диапазоне (0, 1)")
+        self.confidence = confidence
+        self.clustered = clustered
+
     def generate(self, data: List[Dict[str, Any]]) -> List[Tuple[str, float]]:
         grouped_data = group_by_position(data)
 
         report = []
         for position, developers in grouped_data.items():
+            if self.confidence is not None:
+                mean, half_width, count = calculate_performance_interval(
+                    developers, self.confidence
+                )
+                if self.clustered:
+                    half_width = math.nan
+                report.append((position, mean, half_width, count))
+                continue
             avg_performance = calculate_average_performance(developers)
             report.append((position, avg_performance))
 
-        # Сортировка по эффективности (по убыванию)
-        report.sort(key=lambda x: x[1], reverse=True)
-
-        return report
+        return _sort_by_performance(report)
+
+    def generate_from_store(self, store, file_paths: List[str],
+                            filters: Optional[list] = None) -> List[Tuple[str, float]]:
+        if self.confidence is not None:
+            return super().generate_from_store(store, file_paths, filters)
+
+        # Агрегация выполняется в SQL, должности приходят в порядке первого появления
+        report = list(store.average_by('position', 'performance', file_paths, filters))
+        return _sort_by_performance(report)
+
+    def accumulate(self, data: List[Dict[str, Any]], rank: int = 0) -> Dict[str, Any]:
+        # Суммы хранятся точными дробями, поэтому порядок объединения
+        # частичных состояний не влияет на результат. first — место первого
+        # появления должности (номер части, номер строки) для порядка при равенстве
+        sums = {}
+        state = {}
+        for row_no, developer in enumerate(data):
+            position = developer['position']
+            if position not in state:
+                sums[position] = Fraction(0)
+                state[position] = {'count': 0, 'first': [rank, row_no]}
+            sums[position] += Fraction(developer['performance'])
+            state[position]['count'] += 1
+
+        for position, total in sums.items():
+            state[position]['sum'] = str(total)
+        return state
+
+    def merge_states(self, left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+        merged = {}
+        for position in set(left) | set(right):
+            parts = [part[position] for part in (left, right) if position in part]
+            merged[position] = {
+                'sum': str(sum((Fraction(part['sum']) for part in parts), Fraction(0))),
+                'count': sum(part['count'] for part in parts),
+                'first': min(list(part['first']) for part in parts),
+            }
+        return merged
+
+    def finalize(self, state: Dict[str, Any]) -> List[Tuple[str, float]]:
+        ordered = sorted(
+            (values['first'], position, values)
+            for position, values in state.items() if values['count']
+        )
+        # float от точной суммы равен math.fsum по всем строкам, поэтому
+        # среднее совпадает с generate на одном узле
+        report = [
+            (position, float(Fraction(values['sum'])) / values['count'])
+            for _, position, values in ordered
+        ]
+        return _sort_by_performance(report)
 
     def display(self, report_data: List[Tuple[str, float]]) -> None:
+        if self.confidence is not None:
+            self._display_interval(report_data)
+            return
+
         try:
             from tabulate import tabulate
             headers = ["Должность", "Средняя эффективность"]
@@ -44,6 +150,36 @@ class PerformanceReport(Report):
             for position, performance in report_data:
                 print(f"{position:30} {performance:10.2f}")
 
+    def _display_interval(self, report_data: List[Tuple[str, float, float, int]]) -> None:
+        level = f"{self.confidence:.0%}"
+        table_data = []
+        for position, mean, half_width, count in report_data:
+            # Интервал не определен для одной строки в группе и для выборки блоками
+            margin = "—" if math.isnan(half_width) else f"{half_width:.2f}"
+            table_data.append((position, f"{mean:.2f} ± {margin}", f"{count}"))
+
+        try:
+            from tabulate import tabulate
+            headers = ["Должность", f"Средняя эффективность ({level} ДИ)",
+                       "Размер выборки"]
+            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        except ImportError:
+            print(f"Должность\t\t\tСредняя эффективность ({level} ДИ)\tРазмер выборки")
+            print("-" * 70)
+            for position, interval, count in table_data:
+                print(f"{position:30} {interval:>16} {count:>10}")
+
+        if self.clustered:
+            print("Доверительный интервал не рассчитывается для выборки блоками: "
+                  "строки одного блока не независимы")
+
+
+def _sort_by_performance(report: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+    # Общее правило для всех путей: по убыванию эффективности, при равенстве —
+    # в порядке первого появления должности (сортировка устойчива)
+    report.sort(key=lambda x: x[1], reverse=True)
+    return report
+
 
 class ReportFactory:
     _reports = {
@@ -57,17 +193,17 @@ class ReportFactory:
         cls._reports[name] = report_class
 
     @classmethod
-    def create_report(cls, name: str) -> Report:
+    def create_report(cls, name: str, **options: Any) -> Report:
         if name not in cls._reports:
             raise ValueError(
                 f"Неизвестный отчет: {name}. "
                 f"Доступные отчеты: {', '.join(cls._reports.keys())}"
             )
-        return cls._reports[name]()
+        return cls._reports[name](**options)
 
 
-def get_report_generator(report_name: str) -> Report:
-    return ReportFactory.create_report(report_name)
+def get_report_generator(report_name: str, **options: Any) -> Report:
+    return ReportFactory.create_report(report_name, **options)
 
 # РАСКОММЕНТИРОВАТЬ ДЛЯ АКТИВАЦИИ НОВОГО ОТЧЕТА
 """
@@ -0,0 +1,156 @@
+import math
+import os
+import random
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterable, Iterator, Optional, TextIO
+
+# Размер блока для выборки блоками и минимальное число блоков в файле,
+# при котором выборка блоками имеет смысл
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+MIN_BLOCKS = 16
+
+
+class Sampler(ABC):
+    """Однопроходная выборка строк при чтении CSV."""
+
+    def lines(self, file: TextIO) -> Iterable[str]:
+        """Источник строк файла для csv.reader."""
+        return file
+
+    @abstractmethod
+    def slot(self, count: int) -> Optional[int]:
+        """Позиция для очередной строки в выборке из ``count`` записей.
+
+        ``count`` — добавить в конец, другое число — заменить запись,
+        None — строку пропустить.
+        """
+        pass
+
+
+class BernoulliSampler(Sampler):
+    """Каждая строка попадает в выборку независимо с вероятностью ``fraction``."""
+
+    def __init__(self, fraction: float, seed: Optional[int] = None):
+        if not 0 < fraction <= 1:
+            raise ValueError("Доля выборки должна быть в диапазоне (0, 1]")
+        self.fraction = fraction
+        self._random = random.Random(seed)
+
+    def slot(self, count: int) -> Optional[int]:
+        return count if self._random.random() < self.fraction else None
+
+
+class BlockSampler(BernoulliSampler):
+    """Выборка блоков файла с переходом к ним через seek.
+
+    Файл не читается целиком: каждый блок байтов выбирается с вероятностью
+    ``fraction``, и из него берутся строки, начинающиеся внутри блока.
+    Поля в кавычках не должны содержать переводов строк. Для небольших
+    файлов используется построчная выборка Бернулли.
+    """
+
+    def __init__(self, fraction: float, seed: Optional[int] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        super().__init__(fraction, seed)
+        if block_size < 1:
+            raise ValueError("Размер блока должен быть положительным")
+        self.block_size = block_size
+        self._row_level = True
+
+    def lines(self, file: TextIO) -> Iterable[str]:
+        size = os.fstat(file.fileno()).st_size
+        self._row_level = size < self.block_size * MIN_BLOCKS
+        if self._row_level:
+            return file
+        return self._block_lines(file.buffer, size)
+
+    def slot(self, count: int) -> Optional[int]:
+        if self._row_level:
+            return super().slot(count)
+        return count
+
+    def _block_lines(self, raw: BinaryIO, size: int) -> Iterator[str]:
+        header = raw.readline()
+        yield header.decode('utf-8')
+        data_start = raw.tell()
+
+        for start in range(data_start, size, self.block_size):
+            if self._random.random() >= self.fraction:
+                continue
+            end = start + self.block_size
+
+            # Пропускаем хвост строки, начавшейся в предыдущем блоке
+            if start > data_start:
+                raw.seek(start - 1)
+                raw.readline()
+            else:
+                raw.seek(start)
+
+            while raw.tell() < end:
+                line = raw.readline()
+                if not line:
+                    break
+                yield line.decode('utf-8')
+
+
+class ReservoirSampler(Sampler):
+    """Равномерная выборка фиксированного размера (алгоритм L).
+
+    Номер следующей строки для замены вычисляется заранее, поэтому
+    пропущенные строки не требуют генерации случайных чисел.
+    """
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        if size < 1:
+            raise ValueError("Размер выборки должен быть положительным")
+        self.size = size
+        self._random = random.Random(seed)
+        self._seen = 0
+        # Параметры пропусков вычисляются, только когда резервуар заполнен:
+        # при огромном size до этого дело не доходит. Первый шаг _advance
+        # дает номер size + пропуск, как в исходном алгоритме
+        self._log_weight = 0.0
+        self._next = size - 1
+
+    def _uniform(self) -> float:
+        value = self._random.random()
+        while value == 0.0:
+            value = self._random.random()
+        return value
+
+    def _advance(self) -> None:
+        # Вес хранится как логарифм, а log(1 - w) считается через expm1,
+        # чтобы w, близкий к 1, не округлялся до 1 и не давал log(0)
+        self._log_weight += math.log(self._uniform()) / self.size
+        log_rest = math.log(-math.expm1(self._log_weight))
+        self._next += int(math.log(self._uniform()) / log_rest) + 1
+
+    def slot(self, count: int) -> Optional[int]:
+        index = self._seen
+        self._seen += 1
+        if index < self.size:
+            if index == self.size - 1:
+                self._advance()
+            return count
+        if index < self._next:
+            return None
+
+        self._advance()
+        return self._random.randrange(self.size)
+
+
+def make_sampler(fraction: Optional[float] = None, rows: Optional[int] = None,
+                 blocks: bool = False, seed: Optional[int] = None) -> Optional[Sampler]:
+    """Создает выборку по параметрам командной строки."""
+    if fraction is not None and rows is not None:
+        raise ValueError("Нельзя одновременно задать долю и число строк выборки")
+    if blocks and fraction is None:
+        raise ValueError("Выборка блоками требует указать долю выборки")
+
+    if fraction is not None:
+        if blocks:
+            return BlockSampler(fraction, seed)
+        return BernoulliSampler(fraction, seed)
+    if rows is not None:
+        return ReservoirSampler(rows, seed)
+    return None
@@ -0,0 +1,205 @@
+import math
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .filters import RowFilter, check_filter_columns
+from .reader import dataset_fingerprint, read_csv_files
+
+COLUMNS = (
+    'name', 'position', 'completed_tasks', 'performance',
+    'skills', 'team', 'experience_years',
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS developers (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    row_no INTEGER NOT NULL,
+    name TEXT,
+    position TEXT,
+    completed_tasks INTEGER,
+    performance REAL,
+    skills TEXT,
+    team TEXT,
+    experience_years INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_developers_source ON developers (source, row_no);
+CREATE INDEX IF NOT EXISTS idx_developers_position ON developers (position);
+CREATE INDEX IF NOT EXISTS idx_developers_team ON developers (team);
+CREATE INDEX IF NOT EXISTS idx_developers_name ON developers (name);
+"""
+
+# Порядок строк совпадает с порядком чтения CSV: сначала по файлам, затем по строкам
+_ORDER_KEY = "r.ord * 4294967296 + d.row_no"
+
+
+class _FsumAverage:
+    """Агрегат SQLite: среднее с точной суммой, как math.fsum в отчете по CSV.
+
+    Хранит неперекрывающиеся частичные суммы (алгоритм Шевчука), сумма
+    которых точно равна сумме значений, поэтому память не зависит от числа строк.
+    """
+
+    def __init__(self):
+        self.partials = []
+        self.count = 0
+
+    def step(self, value):
+        if value is None:
+            return
+        x = float(value)
+        i = 0
+        for y in self.partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            high = x + y
+            low = y - (high - x)
+            if low:
+                self.partials[i] = low
+                i += 1
+            x = high
+        self.partials[i:] = [x]
+        self.count += 1
+
+    def finalize(self):
+        if not self.count:
+            return None
+        return math.fsum(self.partials) / self.count
+
+
+class SQLiteStore:
+    """Локальное SQLite-хранилище данных из CSV с инкрементальной загрузкой."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        # Встроенный AVG суммирует с накоплением ошибки округления и может
+        # не совпасть со средним по CSV
+        self.connection.create_aggregate('fsum_avg', 1, _FsumAverage)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def load(self, file_paths: List[str]) -> List[str]:
+        """Загружает изменившиеся файлы и возвращает список перезагруженных путей."""
+        stored = dict(
+            (path, (size, mtime_ns, inode))
+            for path, size, mtime_ns, inode in self.connection.execute(
+                "SELECT path, size, mtime_ns, inode FROM files"
+            )
+        )
+
+        changed = []
+        for path, size, mtime_ns, inode in dataset_fingerprint(file_paths):
+            if stored.get(path) != (size, mtime_ns, inode) and path not in changed:
+                changed.append(path)
+                stored[path] = (size, mtime_ns, inode)
+
+        if not changed:
+            return []
+
+        # Разбор CSV выполняем до начала транзакции, чтобы ошибка в данных
+        # не оставила базу в промежуточном состоянии
+        parsed = [(path, read_csv_files([path])) for path in changed]
+
+        with self.connection:
+            for path, rows in parsed:
+                self.connection.execute(
+                    "DELETE FROM developers WHERE source = ?", (path,)
+                )
+                self.connection.executemany(
+                    "INSERT INTO developers (source, row_no, name, position, "
+                    "completed_tasks, performance, skills, team, experience_years) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (path, row_no) + tuple(row.get(column) for column in COLUMNS)
+                        for row_no, row in enumerate(rows)
+                    ),
+                )
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, inode) "
+                    "VALUES (?, ?, ?, ?)",
+                    (path,) + stored[path],
+                )
+
+        return changed
+
+    def _select_files(self, file_paths: List[str]) -> None:
+        """Заполняет временную таблицу запрошенных файлов с их порядком."""
+        self.connection.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS requested (source TEXT, ord INTEGER)"
+        )
+        self.connection.execute("DELETE FROM requested")
+        self.connection.executemany(
+            "INSERT INTO requested (source, ord) VALUES (?, ?)",
+            ((os.path.abspath(path), ord_no) for ord_no, path in enumerate(file_paths)),
+        )
+
+    def query(self, sql: str, file_paths: List[str],
+              filters: Optional[List[RowFilter]] = None) -> List[Tuple[Any, ...]]:
+        """Выполняет запрос к строкам запрошенных файлов.
+
+        В запросе доступны источник строк ``{rows}`` (таблица ``developers AS d``,
+        присоединенная к ``requested AS r``), условие ``{where}`` из фильтров
+        и выражение порядка строк ``{order}``.
+        """
+        conditions = ['1']
+        params = []
+        check_filter_columns(filters or [], COLUMNS)
+        for row_filter in filters or []:
+            condition, param = row_filter.to_sql()
+            conditions.append(condition)
+            params.append(param)
+
+        self._select_files(file_paths)
+        sql = sql.format(
+            rows="developers AS d JOIN requested AS r ON d.source = r.source",
+            where=' AND '.join(conditions),
+            order=_ORDER_KEY,
+        )
+        return self.connection.execute(sql, params).fetchall()
+
+    def fetch_all(self, file_paths: List[str],
+                  filters: Optional[List[RowFilter]] = None,
+                  columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Возвращает строки в том же виде и порядке, что и read_csv_files."""
+        columns = tuple(columns or COLUMNS)
+        for column in columns:
+            _check_column(column)
+        select = ', '.join(f"d.{column}" for column in columns)
+        rows = self.query(
+            f"SELECT {select} FROM {{rows}} WHERE {{where}} ORDER BY {{order}}",
+            file_paths, filters,
+        )
+        return [dict(zip(columns, row)) for row in rows]
+
+    def average_by(self, group_column: str, value_column: str, file_paths: List[str],
+                   filters: Optional[List[RowFilter]] = None) -> List[Tuple[Any, float]]:
+        """Среднее значение по группам в порядке первого появления группы."""
+        _check_column(group_column)
+        _check_column(value_column)
+        return self.query(
+            f"SELECT d.{group_column}, fsum_avg(d.{value_column}) FROM {{rows}} "
+            f"WHERE {{where}} GROUP BY d.{group_column} ORDER BY MIN({{order}})",
+            file_paths, filters,
+        )
+
+
+def _check_column(column: str) -> None:
+    # Имена столбцов подставляются в SQL, поэтому допускаются только известные
+    if column not in COLUMNS:
+        raise ValueError(f"Неизвестный столбец: {column}")
@@ -0,0 +1,164 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+from script import cache as cache_module
+from script import job as job_module
+from script.cache import ReportCache, make_cache_key, cached_generate
+from script.cli import main
+
+
+CSV_CONTENT = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,"Python, Django",API Team,5
+Maria Petrova,Frontend Developer,38,4.7,"React, TypeScript",Web Team,4"""
+
+
+def create_test_csv(content: str) -> str:
+    """Создает временный CSV файл с заданным содержимым."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv',
+                                     delete=False, encoding='utf-8') as f:
+        f.write(content)
+        return f.name
+
+
+def test_cache_key_depends_on_report_and_options():
+    """Тест зависимости ключа от названия отчета и параметров."""
+    file_path = create_test_csv(CSV_CONTENT)
+    try:
+        key = make_cache_key('performance', [file_path])
+        assert key == make_cache_key('performance', [file_path])
+        assert key != make_cache_key('skills', [file_path])
+        assert key != make_cache_key('performance', [file_path], {'sample': 0.1})
+    finally:
+        Path(file_path).unlink()
+
+
+def test_cache_key_changes_when_file_changes():
+    """Тест инвалидации ключа при изменении входного файла."""
+    file_path = create_test_csv(CSV_CONTENT)
+    try:
+        key = make_cache_key('performance', [file_path])
+        with open(file_path, 'a', encoding='utf-8') as f:
+            f.write("\nJohn Smith,Backend Developer,40,4.0,Go,API Team,3")
+        assert make_cache_key('performance', [file_path]) != key
+    finally:
+        Path(file_path).unlink()
+
+
+def test_report_cache_lru_eviction():
+    """Тест вытеснения давно не использованных записей."""
+    cache = ReportCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+
+
+def test_report_cache_ttl():
+    """Тест устаревания записей по TTL."""
+    cache = ReportCache(ttl=10)
+    cache.set('a', [('Backend Developer', 4.8)])
+
+    with patch.object(cache_module.time, 'time', return_value=time.time() + 60):
+        assert cache.get('a') is None
+
+
+def test_report_cache_persists_on_disk():
+    """Тест сохранения результатов между экземплярами кэша."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ReportCache(cache_dir=cache_dir).set('a', [('Backend Developer', 4.8)])
+
+        restored = ReportCache(cache_dir=cache_dir)
+        assert restored.get('a') == [('Backend Developer', 4.8)]
+
+        # Записи на диске хранятся в JSON, а не в pickle
+        assert list(Path(cache_dir).glob('*.json'))
+        assert not list(Path(cache_dir).glob('*.pickle'))
+
+        restored.clear()
+        assert ReportCache(cache_dir=cache_dir).get('a') is None
+
+
+def test_report_cache_drops_corrupted_entry():
+    """Тест удаления поврежденной записи на диске."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        Path(cache_dir, 'a.json').write_text('{"value": 1', encoding='utf-8')
+
+        assert ReportCache(cache_dir=cache_dir).get('a') is None
+        assert not Path(cache_dir, 'a.json').exists()
+
+
+def test_cached_generate_skips_reading():
+    """Тест повторного запроса без чтения CSV."""
+    file_path = create_test_csv(CSV_CONTENT)
+    cache = ReportCache()
+    try:
+        first = cached_generate('performance', [file_path], cache=cache)
+
+        with patch.object(job_module, 'read_csv_files') as mock_read:
+            second = cached_generate('performance', [file_path], cache=cache)
+            mock_read.assert_not_called()
+
+        assert first == second
+        assert first[0][0] == 'Backend Developer'
+    finally:
+        Path(file_path).unlink()
+
+
+def test_cli_uses_disk_cache(capsys, monkeypatch):
+    """Тест CLI с кэшем на диске."""
+    file_path = create_test_csv(CSV_CONTENT)
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            test_args = ['script.py', '--files', file_path, '--report', 'performance',
+                         '--cache-dir', cache_dir]
+            monkeypatch.setattr(sys, 'argv', test_args)
+            main()
+            first = capsys.readouterr().out
+
+            with patch.object(job_module, 'read_csv_files') as mock_read:
+                main()
+                mock_read.assert_not_called()
+
+            assert capsys.readouterr().out == first
+            assert "Backend Developer" in first
+    finally:
+        Path(file_path).unlink()
+
+
+def test_cached_generate_skips_unseeded_sample():
+    """Тест: выборка без seed не кэшируется, с seed — кэшируется."""
+    file_path = create_test_csv(CSV_CONTENT)
+    cache = ReportCache()
+    try:
+        cached_generate('performance', [file_path], cache=cache, options={'sample': 0.5})
+        assert len(cache) == 0
+
+        cached_generate('performance', [file_path], cache=cache,
+                        options={'sample': 0.5, 'seed': 1})
+        assert len(cache) == 1
+    finally:
+        Path(file_path).unlink()
+
+
+def test_cli_does_not_cache_unseeded_sample(capsys, monkeypatch):
+    """Тест CLI: выборка без seed не сохраняется в кэш на диске."""
+    file_path = create_test_csv(CSV_CONTENT)
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            test_args = ['script.py', '--files', file_path, '--report', 'performance',
+                         '--sample', '0.5', '--cache-dir', cache_dir]
+            monkeypatch.setattr(sys, 'argv', test_args)
+            main()
+
+            assert not list(Path(cache_dir).glob('*.json'))
+    finally:
+        Path(file_path).unlink()
@@ -104,7 +104,7 @@ Maria Petrova,Frontend Developer,38,4.7,"React, TypeScript",Web Team,4"""
 def test_cli_with_invalid_csv_data(capsys, monkeypatch):
     """Тест CLI с неверными данными в CSV."""
     csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
-Alex Ivanov,Backend Developer,not_a_number,4.8,Python,API Team,5"""
+Alex Ivanov,Backend Developer,45,not_a_number,Python,API Team,5"""
 
     with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False,
                                      encoding='utf-8') as f:
@@ -137,13 +137,13 @@ Alex Ivanov,Backend Developer,45,4.8,Python,API Team,5"""
         file_path = f.name
 
     try:
-        # Импортируем модуль cli, чтобы подменить функцию в нём
-        from script import cli
+        # Отчет создается в модуле job, поэтому подменяем функцию там
+        from script import job
 
         def mock_get_report_generator(report_name):
             raise Exception("Искусственная ошибка генерации")
 
-        monkeypatch.setattr(cli, 'get_report_generator', mock_get_report_generator)
+        monkeypatch.setattr(job, 'get_report_generator', mock_get_report_generator)
 
         test_args = ['script.py', '--files', file_path, '--report', 'performance']
         monkeypatch.setattr(sys, 'argv', test_args)
@@ -155,4 +155,70 @@ Alex Ivanov,Backend Developer,45,4.8,Python,API Team,5"""
         captured = capsys.readouterr()
         assert "Ошибка при генерации отчета" in captured.err
     finally:
-        Path(file_path).unlink()
\ No newline at end of file
+        Path(file_path).unlink()
+
+def test_cli_with_where_filter(capsys, monkeypatch):
+    """Тест CLI с фильтром строк."""
+    csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,"Python, Django",API Team,5
+Maria Petrova,Frontend Developer,38,4.7,"React, TypeScript",Web Team,4"""
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False,
+                                     encoding='utf-8') as f:
+        f.write(csv_content)
+        file_path = f.name
+
+    try:
+        test_args = ['script.py', '--files', file_path, '--report', 'performance',
+                     '--where', 'team=API Team']
+        monkeypatch.setattr(sys, 'argv', test_args)
+
+        main()
+
+        captured = capsys.readouterr()
+        assert "Backend Developer" in captured.out
+        assert "Frontend Developer" not in captured.out
+    finally:
+        Path(file_path).unlink()
+
+
+def test_cli_with_invalid_where_filter(capsys, monkeypatch):
+    """Тест CLI с неверным фильтром."""
+    test_args = ['script.py', '--files', 'data/employees1.csv', '--report', 'performance',
+                 '--where', 'team']
+    monkeypatch.setattr(sys, 'argv', test_args)
+
+    with pytest.raises(SystemExit) as e:
+        main()
+
+    assert e.value.code == 1
+    captured = capsys.readouterr()
+    assert "Неверный формат фильтра" in captured.err
+
+
+def test_cli_with_sample(capsys, monkeypatch):
+    """Тест CLI в режиме выборки."""
+    test_args = ['script.py', '--files', 'data/employees1.csv', 'data/employees2.csv',
+                 '--report', 'performance', '--sample-rows', '5', '--seed', '1']
+    monkeypatch.setattr(sys, 'argv', test_args)
+
+    main()
+
+    captured = capsys.readouterr()
+    assert "ДИ" in captured.out
+    assert "Размер выборки" in captured.out
+
+
+def test_cli_with_sample_and_db(capsys, monkeypatch):
+    """Тест CLI: выборка несовместима с SQLite хранилищем."""
+    test_args = ['script.py', '--files', 'data/employees1.csv', '--report', 'performance',
+                 '--sample', '0.5', '--db', 'unused.sqlite']
+    monkeypatch.setattr(sys, 'argv', test_args)
+
+    with pytest.raises(SystemExit) as e:
+        main()
+
+    assert e.value.code == 1
+    captured = capsys.readouterr()
+    assert "Выборка не поддерживается" in captured.err
+    assert not Path('unused.sqlite').exists()
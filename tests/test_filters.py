@@ -0,0 +1,68 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+import pytest
+from script.filters import CategoryDictionary, parse_filter, parse_filters
+
+
+def test_parse_filter_equality():
+    """Тест разбора фильтра на равенство."""
+    row_filter = parse_filter('team=API Team')
+    assert row_filter.column == 'team'
+    assert row_filter.operator_symbol == '='
+    assert row_filter.value == 'API Team'
+    assert row_filter.matches('API Team')
+    assert not row_filter.matches('Web Team')
+
+
+def test_parse_filter_numeric():
+    """Тест числовых фильтров с двухсимвольными операторами."""
+    row_filter = parse_filter('experience_years>=5')
+    assert row_filter.operator_symbol == '>='
+    assert row_filter.matches('5')
+    assert row_filter.matches('7')
+    assert not row_filter.matches('4')
+
+    assert parse_filter('performance < 4.7').matches('4.6')
+    assert parse_filter('position!=QA Engineer').matches('Backend Developer')
+
+
+def test_parse_filter_invalid():
+    """Тест обработки неверных фильтров."""
+    with pytest.raises(ValueError, match="Неверный формат фильтра"):
+        parse_filter('team')
+    with pytest.raises(ValueError, match="Неверный формат фильтра"):
+        parse_filter('=API Team')
+    with pytest.raises(ValueError, match="Неверное значение фильтра"):
+        parse_filter('experience_years>=five')
+
+
+def test_parse_filters_empty():
+    """Тест разбора пустого списка фильтров."""
+    assert parse_filters(None) == []
+
+
+def test_filter_bind_evaluates_once_per_value():
+    """Тест проверки по кодам словаря: предикат считается один раз на значение."""
+    dictionary = CategoryDictionary()
+    row_filter = parse_filter('team=API Team')
+    calls = []
+    original = row_filter.matches
+
+    def counting_matches(raw):
+        calls.append(raw)
+        return original(raw)
+
+    row_filter.matches = counting_matches
+    matches_code = row_filter.bind(dictionary)
+
+    results = [matches_code(dictionary.encode(team))
+               for team in ['API Team', 'Web Team', 'API Team', 'Web Team']]
+
+    assert results == [True, False, True, False]
+    assert calls == ['API Team', 'Web Team']
+
+
+def test_filter_to_sql():
+    """Тест преобразования фильтра в условие SQL."""
+    assert parse_filter('experience_years>=5').to_sql() == ('d.experience_years >= ?', 5)
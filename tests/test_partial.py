@@ -0,0 +1,195 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+import itertools
+import json
+import tempfile
+from functools import reduce
+from pathlib import Path
+import pytest
+from script.partial import merge_partials, read_partial, write_partial
+from script.reports import PerformanceReport, Report
+from script.cli import main
+
+DATA = [
+    {'position': 'Backend Developer', 'performance': 4.8},
+    {'position': 'Frontend Developer', 'performance': 4.7},
+    {'position': 'Backend Developer', 'performance': 4.1},
+    {'position': 'QA Engineer', 'performance': 4.3},
+    {'position': 'Frontend Developer', 'performance': 4.9},
+    {'position': 'Backend Developer', 'performance': 4.6},
+    {'position': 'DevOps Engineer', 'performance': 4.4},
+    {'position': 'Data Scientist', 'performance': 4.8},
+    {'position': 'Data Scientist', 'performance': 4.8},
+    {'position': 'Mobile Developer', 'performance': 4.3},
+]
+
+
+def split_states(report, data, sizes):
+    """Частичные состояния для последовательных частей данных с их номерами."""
+    states = []
+    start = 0
+    for rank, size in enumerate(sizes):
+        states.append(report.accumulate(data[start:start + size], rank=rank))
+        start += size
+    return states
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as directory:
+        yield directory
+
+
+def test_merge_equals_single_node():
+    """Тест: объединение частей совпадает с generate на одном узле, включая равенства."""
+    report = PerformanceReport()
+    expected = report.generate(DATA)
+
+    # Frontend Developer и Data Scientist (4.8), QA Engineer и Mobile Developer
+    # (4.3) имеют одинаковую эффективность и идут в порядке первого появления
+    assert [position for position, _ in expected] == [
+        'Frontend Developer', 'Data Scientist', 'Backend Developer',
+        'DevOps Engineer', 'QA Engineer', 'Mobile Developer',
+    ]
+
+    for sizes in ([10], [2, 3, 5], [1, 1, 1, 7], [4, 4, 2]):
+        states = split_states(report, DATA, sizes)
+        assert report.finalize(reduce(report.merge_states, states)) == expected
+
+
+def test_merge_is_commutative_and_associative():
+    """Тест: порядок и группировка объединения не влияют на результат."""
+    report = PerformanceReport()
+    parts = split_states(report, DATA, [3, 2, 3, 2])
+    expected = reduce(report.merge_states, parts)
+
+    for order in itertools.permutations(parts):
+        assert reduce(report.merge_states, order) == expected
+
+    a, b, c, d = parts
+    merge = report.merge_states
+    assert merge(merge(a, b), merge(c, d)) == merge(a, merge(b, merge(c, d)))
+
+
+def test_merge_with_empty_state():
+    """Тест объединения с пустым состоянием."""
+    report = PerformanceReport()
+    state = report.accumulate(DATA)
+    assert report.merge_states(state, report.accumulate([])) == state
+
+
+def test_partial_file_roundtrip(tmp_dir):
+    """Тест записи и чтения файла состояния."""
+    report = PerformanceReport()
+    path = os.path.join(tmp_dir, 'state.json')
+    write_partial(path, 'performance', report.accumulate(DATA))
+
+    report_name, where, state = read_partial(path)
+    assert report_name == 'performance'
+    assert where == []
+    assert state == report.accumulate(DATA)
+
+
+def test_partial_file_version_mismatch(tmp_dir):
+    """Тест отказа от файла состояния другой версии."""
+    path = os.path.join(tmp_dir, 'state.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'format': 'dev-analytics-partial', 'version': 999,
+                   'report': 'performance', 'state': {}}, f)
+
+    with pytest.raises(ValueError, match="Неподдерживаемая версия"):
+        read_partial(path)
+
+
+def test_merge_partials_different_reports(tmp_dir):
+    """Тест объединения состояний разных отчетов."""
+    first = os.path.join(tmp_dir, 'first.json')
+    second = os.path.join(tmp_dir, 'second.json')
+    write_partial(first, 'performance', {})
+    write_partial(second, 'skills', {})
+
+    with pytest.raises(ValueError, match="разным отчетам"):
+        merge_partials([first, second])
+
+
+def test_merge_partials_different_filters(tmp_dir):
+    """Тест: состояния с разными фильтрами не объединяются."""
+    first = os.path.join(tmp_dir, 'first.json')
+    second = os.path.join(tmp_dir, 'second.json')
+    write_partial(first, 'performance', {}, ['team=API Team'])
+    write_partial(second, 'performance', {})
+
+    with pytest.raises(ValueError, match="разными фильтрами"):
+        merge_partials([first, second])
+
+
+def test_report_without_partial_support():
+    """Тест отчета без поддержки частичной агрегации."""
+    class SimpleReport(Report):
+        def generate(self, data):
+            return []
+
+        def display(self, report_data):
+            pass
+
+    with pytest.raises(ValueError, match="не поддерживает частичную агрегацию"):
+        SimpleReport().accumulate(DATA)
+
+
+def test_cli_partial_and_merge(capsys, monkeypatch, tmp_dir):
+    """Тест CLI: dev partial на каждом файле и dev merge совпадают с запуском на одном узле."""
+    files = ['data/employees1.csv', 'data/employees2.csv']
+
+    monkeypatch.setattr(sys, 'argv', ['script.py', '--files'] + files +
+                        ['--report', 'performance'])
+    main()
+    single = capsys.readouterr().out
+
+    states = []
+    for rank, file_path in enumerate(files):
+        state_path = os.path.join(tmp_dir, f'state{rank}.json')
+        monkeypatch.setattr(sys, 'argv', ['script.py', 'partial', '--files', file_path,
+                                          '--report', 'performance',
+                                          '--rank', str(rank), '--output', state_path])
+        main()
+        states.append(state_path)
+
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'merge'] + states[::-1])
+    main()
+    merged = capsys.readouterr().out
+
+    assert merged == single
+    assert "Backend Developer" in merged
+
+
+def test_cli_merge_rejects_different_filters(capsys, monkeypatch, tmp_dir):
+    """Тест CLI: dev merge не объединяет состояния с разными фильтрами."""
+    states = []
+    for i, extra in enumerate([['--where', 'team=API Team'], []]):
+        state_path = os.path.join(tmp_dir, f'state{i}.json')
+        monkeypatch.setattr(sys, 'argv', ['script.py', 'partial', '--files',
+                                          'data/employees1.csv', '--report', 'performance',
+                                          '--output', state_path] + extra)
+        main()
+        states.append(state_path)
+
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'merge'] + states)
+    with pytest.raises(SystemExit) as e:
+        main()
+
+    assert e.value.code == 1
+    assert "разными фильтрами" in capsys.readouterr().err
+
+
+def test_cli_merge_invalid_state(capsys, monkeypatch, tmp_dir):
+    """Тест CLI: объединение файла, не являющегося состоянием."""
+    path = os.path.join(tmp_dir, 'state.json')
+    Path(path).write_text('not json', encoding='utf-8')
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'merge', path])
+
+    with pytest.raises(SystemExit) as e:
+        main()
+
+    assert e.value.code == 1
+    assert "не является файлом состояния" in capsys.readouterr().err
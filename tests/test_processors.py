@@ -1,8 +1,12 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath('.'))
+import math
 import pytest
-from script.processors import group_by_position, calculate_average_performance
+from script.processors import (
+    group_by_position, calculate_average_performance, calculate_performance_interval,
+    student_t_quantile,
+)
 
 
 def test_group_by_position():
@@ -44,4 +48,38 @@ def test_calculate_average_performance_single():
     """Тест вычисления средней эффективности для одного разработчика."""
     developers = [{'name': 'Alex', 'performance': 4.5}]
     avg = calculate_average_performance(developers)
-    assert avg == 4.5
\ No newline at end of file
+    assert avg == 4.5
+
+
+def test_calculate_performance_interval():
+    """Тест доверительного интервала для средней эффективности."""
+    developers = [
+        {'name': 'Alex', 'performance': 4.0},
+        {'name': 'Maria', 'performance': 5.0},
+        {'name': 'John', 'performance': 3.0},
+    ]
+
+    mean, half_width, count = calculate_performance_interval(developers, 0.95)
+    assert mean == pytest.approx(4.0)
+    # Для трех значений используется t-квантиль с двумя степенями свободы
+    assert half_width == pytest.approx(4.3027 * 1.0 / 3 ** 0.5, rel=1e-4)
+    assert count == 3
+
+
+def test_calculate_performance_interval_single():
+    """Тест доверительного интервала для одного разработчика."""
+    mean, half_width, count = calculate_performance_interval(
+        [{'name': 'Alex', 'performance': 4.5}]
+    )
+    assert mean == 4.5
+    assert math.isnan(half_width)
+    assert count == 1
+
+
+def test_student_t_quantile():
+    """Тест квантилей распределения Стьюдента по табличным значениям."""
+    assert student_t_quantile(0.975, 1) == pytest.approx(12.7062, rel=1e-4)
+    assert student_t_quantile(0.975, 4) == pytest.approx(2.7764, rel=1e-4)
+    assert student_t_quantile(0.95, 10) == pytest.approx(1.8125, rel=1e-4)
+    # При большом числе степеней свободы совпадает с нормальным распределением
+    assert student_t_quantile(0.975, 100000) == pytest.approx(1.95996, rel=1e-4)
@@ -161,4 +161,144 @@ Alex Ivanov,Backend Developer,45,Python,API Team,5"""
         with pytest.raises(ValueError, match="Неверный формат данных"):
             read_csv_files([file_path])
     finally:
-        Path(file_path).unlink()
\ No newline at end of file
+        Path(file_path).unlink()
+
+def test_read_csv_files_with_filters():
+    """Тест фильтрации строк при чтении."""
+    from script.filters import parse_filters
+
+    csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,"Python, Django",API Team,5
+Maria Petrova,Frontend Developer,38,4.7,"React, TypeScript",Web Team,4
+John Smith,Backend Developer,29,4.6,"Go, PostgreSQL",API Team,3"""
+
+    file_path = create_test_csv(csv_content)
+    try:
+        data = read_csv_files([file_path], parse_filters(['team=API Team']))
+        assert [d['name'] for d in data] == ['Alex Ivanov', 'John Smith']
+
+        data = read_csv_files([file_path], parse_filters(
+            ['team=API Team', 'experience_years>=5']
+        ))
+        assert [d['name'] for d in data] == ['Alex Ivanov']
+        assert data[0]['experience_years'] == 5
+    finally:
+        Path(file_path).unlink()
+
+
+def test_read_csv_files_filter_skips_conversion():
+    """Тест: отброшенные фильтром строки не преобразуются."""
+    from script.filters import parse_filters
+
+    csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,Python,API Team,5
+Broken Row,QA Engineer,invalid,invalid,Selenium,QA Team,2"""
+
+    file_path = create_test_csv(csv_content)
+    try:
+        data = read_csv_files([file_path], parse_filters(['team=API Team']))
+        assert len(data) == 1
+    finally:
+        Path(file_path).unlink()
+
+
+def test_read_csv_files_shares_category_strings():
+    """Тест словарного кодирования должностей и команд."""
+    csv_content1 = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,Python,API Team,5"""
+    csv_content2 = """name,position,completed_tasks,performance,skills,team,experience_years
+John Smith,Backend Developer,29,4.6,Go,API Team,3"""
+
+    file1 = create_test_csv(csv_content1)
+    file2 = create_test_csv(csv_content2)
+    try:
+        data = read_csv_files([file1, file2])
+        assert data[0]['position'] is data[1]['position']
+        assert data[0]['team'] is data[1]['team']
+    finally:
+        Path(file1).unlink()
+        Path(file2).unlink()
+
+
+def test_read_csv_files_filter_unknown_column():
+    """Тест фильтра по отсутствующему столбцу."""
+    from script.filters import parse_filters
+
+    csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,Python,API Team,5"""
+
+    file_path = create_test_csv(csv_content)
+    try:
+        with pytest.raises(ValueError, match="Неизвестный столбец фильтра: salary"):
+            read_csv_files([file_path], parse_filters(['salary>100']))
+    finally:
+        Path(file_path).unlink()
+
+
+def test_read_csv_files_with_columns():
+    """Тест чтения только нужных отчету столбцов."""
+    csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,invalid,4.8,"Python, Django",API Team,invalid"""
+
+    file_path = create_test_csv(csv_content)
+    try:
+        data = read_csv_files([file_path], columns=('position', 'performance'))
+        assert data == [{'position': 'Backend Developer', 'performance': 4.8}]
+    finally:
+        Path(file_path).unlink()
+
+
+def test_read_csv_files_columns_with_filter():
+    """Тест фильтра по столбцу, не входящему в проекцию."""
+    from script.filters import parse_filters
+
+    csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,Python,API Team,5
+Maria Petrova,Frontend Developer,38,4.7,React,Web Team,4"""
+
+    file_path = create_test_csv(csv_content)
+    try:
+        data = read_csv_files([file_path], parse_filters(['experience_years<5']),
+                              columns=('position',))
+        assert data == [{'position': 'Frontend Developer'}]
+    finally:
+        Path(file_path).unlink()
+
+
+def test_read_csv_files_columns_missing():
+    """Тест отсутствия запрошенного столбца."""
+    csv_content = """name,position,completed_tasks
+Alex Ivanov,Backend Developer,45"""
+
+    file_path = create_test_csv(csv_content)
+    try:
+        with pytest.raises(ValueError, match="Неверный формат данных"):
+            read_csv_files([file_path], columns=('position', 'performance'))
+    finally:
+        Path(file_path).unlink()
+
+
+def test_read_csv_files_encodes_only_used_categories():
+    """Тест: столбцы вне проекции и фильтров не кодируются словарем."""
+    from unittest.mock import patch
+    from script.filters import CategoryDictionary
+
+    csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,Python,API Team,5
+Maria Petrova,Frontend Developer,38,4.7,React,Web Team,4"""
+
+    file_path = create_test_csv(csv_content)
+    encoded = []
+    original = CategoryDictionary.encode
+
+    def tracking_encode(self, raw):
+        encoded.append(raw)
+        return original(self, raw)
+
+    try:
+        with patch.object(CategoryDictionary, 'encode', tracking_encode):
+            data = read_csv_files([file_path], columns=('position', 'performance'))
+        assert len(data) == 2
+        assert encoded == ['Backend Developer', 'Frontend Developer']
+    finally:
+        Path(file_path).unlink()
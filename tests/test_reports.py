@@ -1,3 +1,4 @@
+import math
 import pytest
 import sys
 import os
@@ -61,6 +62,71 @@ def test_performance_report_display(capsys):
         assert "4.5" in captured.out
 
 
+def test_performance_report_columns():
+    """Тест столбцов, необходимых отчету по эффективности."""
+    assert PerformanceReport.columns == ('position', 'performance')
+
+
+def test_performance_report_with_confidence():
+    """Тест отчета по выборке с доверительными интервалами."""
+    data = [
+        {'position': 'Backend Developer', 'performance': 4.0},
+        {'position': 'Frontend Developer', 'performance': 5.0},
+        {'position': 'Backend Developer', 'performance': 3.0},
+        {'position': 'Frontend Developer', 'performance': 4.0},
+    ]
+
+    report = PerformanceReport(confidence=0.95)
+    result = report.generate(data)
+
+    assert [row[0] for row in result] == ['Frontend Developer', 'Backend Developer']
+    position, mean, half_width, count = result[0]
+    assert mean == pytest.approx(4.5)
+    assert half_width > 0
+    assert count == 2
+
+
+def test_performance_report_display_with_confidence(capsys):
+    """Тест отображения отчета по выборке."""
+    report = PerformanceReport(confidence=0.9)
+
+    with patch.dict('sys.modules', {'tabulate': None}):
+        report.display([('Frontend Developer', 4.5, 0.25, 40),
+                        ('QA Engineer', 4.1, float('nan'), 1)])
+        captured = capsys.readouterr()
+        assert "90% ДИ" in captured.out
+        assert "4.50 ± 0.25" in captured.out
+        assert "4.10 ± —" in captured.out
+        assert "40" in captured.out
+
+
+def test_performance_report_clustered_has_no_interval(capsys):
+    """Тест: для выборки блоками интервал не строится."""
+    data = [
+        {'position': 'Backend Developer', 'performance': 4.0},
+        {'position': 'Backend Developer', 'performance': 3.0},
+    ]
+
+    report = PerformanceReport(confidence=0.95, clustered=True)
+    result = report.generate(data)
+    position, mean, half_width, count = result[0]
+    assert mean == pytest.approx(3.5)
+    assert math.isnan(half_width)
+    assert count == 2
+
+    with patch.dict('sys.modules', {'tabulate': None}):
+        report.display(result)
+        captured = capsys.readouterr()
+        assert "3.50 ± —" in captured.out
+        assert "не рассчитывается для выборки блоками" in captured.out
+
+
+def test_performance_report_invalid_confidence():
+    """Тест проверки уровня доверия."""
+    with pytest.raises(ValueError, match="Уровень доверия"):
+        PerformanceReport(confidence=95)
+
+
 def test_report_factory():
     """Тест фабрики отчетов."""
     report = ReportFactory.create_report('performance')
@@ -0,0 +1,137 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+import tempfile
+from pathlib import Path
+import pytest
+from script.reader import read_csv_files
+from script.sampling import (
+    BernoulliSampler, BlockSampler, ReservoirSampler, make_sampler
+)
+
+HEADER = "name,position,completed_tasks,performance,skills,team,experience_years\n"
+
+
+def create_large_csv(rows: int) -> str:
+    """Создает CSV файл с заданным числом строк."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv',
+                                     delete=False, encoding='utf-8') as f:
+        f.write(HEADER)
+        for i in range(rows):
+            f.write(f'Dev {i},Backend Developer,{i},{i % 5}.5,"Python, Go",API Team,{i % 10}\n')
+        return f.name
+
+
+@pytest.fixture
+def large_csv():
+    file_path = create_large_csv(1000)
+    yield file_path
+    Path(file_path).unlink()
+
+
+def test_bernoulli_sampler_fraction(large_csv):
+    """Тест выборки Бернулли: размер близок к заданной доле."""
+    data = read_csv_files([large_csv], sampler=BernoulliSampler(0.2, seed=1))
+    assert 120 < len(data) < 280
+    names = [row['name'] for row in data]
+    assert len(set(names)) == len(names)
+
+
+def test_bernoulli_sampler_invalid_fraction():
+    """Тест проверки доли выборки."""
+    with pytest.raises(ValueError, match="Доля выборки"):
+        BernoulliSampler(0)
+    with pytest.raises(ValueError, match="Доля выборки"):
+        BernoulliSampler(1.5)
+
+
+def test_reservoir_sampler_size(large_csv):
+    """Тест выборки фиксированного размера."""
+    data = read_csv_files([large_csv], sampler=ReservoirSampler(50, seed=2))
+    assert len(data) == 50
+    names = {row['name'] for row in data}
+    assert len(names) == 50
+
+
+def test_reservoir_sampler_small_input(large_csv):
+    """Тест выборки, размер которой больше числа строк."""
+    data = read_csv_files([large_csv], sampler=ReservoirSampler(5000, seed=2))
+    assert data == read_csv_files([large_csv])
+
+
+def test_reservoir_sampler_huge_size(large_csv):
+    """Тест выборки огромного размера: без ошибки math domain error."""
+    sampler = ReservoirSampler(10 ** 17, seed=5)
+    assert read_csv_files([large_csv], sampler=sampler) == read_csv_files([large_csv])
+
+
+def test_reservoir_sampler_weight_close_to_one():
+    """Тест пропусков при весе, неотличимом от 1 в обычной арифметике."""
+    sampler = ReservoirSampler(3, seed=6)
+    for _ in range(3):
+        sampler.slot(0)
+    sampler._log_weight = -1e-30
+    sampler._advance()
+    assert sampler._next > 3
+
+
+def test_reservoir_sampler_is_uniform():
+    """Тест равномерности: каждая строка попадает в выборку примерно одинаково часто."""
+    hits = [0] * 20
+    for seed in range(2000):
+        sampler = ReservoirSampler(5, seed=seed)
+        reservoir = []
+        for item in range(20):
+            slot = sampler.slot(len(reservoir))
+            if slot is None:
+                continue
+            if slot == len(reservoir):
+                reservoir.append(item)
+            else:
+                reservoir[slot] = item
+        for item in reservoir:
+            hits[item] += 1
+
+    # Ожидаемая частота: 2000 * 5 / 20 = 500
+    assert all(400 < count < 600 for count in hits)
+
+
+def test_block_sampler_full_fraction(large_csv):
+    """Тест выборки блоками: при доле 1 читаются все строки ровно один раз."""
+    sampler = BlockSampler(1.0, seed=3, block_size=64)
+    assert read_csv_files([large_csv], sampler=sampler) == read_csv_files([large_csv])
+
+
+def test_block_sampler_rows_are_whole(large_csv):
+    """Тест выборки блоками: строки не обрезаются и не повторяются."""
+    sampler = BlockSampler(0.3, seed=4, block_size=64)
+    data = read_csv_files([large_csv], sampler=sampler)
+    full = read_csv_files([large_csv])
+
+    names = [row['name'] for row in data]
+    assert len(set(names)) == len(names)
+    assert all(row in full for row in data)
+    assert 150 < len(data) < 450
+
+
+def test_block_sampler_small_file_uses_rows():
+    """Тест выборки блоками для небольшого файла."""
+    file_path = create_large_csv(10)
+    try:
+        data = read_csv_files([file_path], sampler=BlockSampler(1.0))
+        assert len(data) == 10
+    finally:
+        Path(file_path).unlink()
+
+
+def test_make_sampler():
+    """Тест создания выборки по параметрам."""
+    assert make_sampler() is None
+    assert isinstance(make_sampler(fraction=0.5), BernoulliSampler)
+    assert isinstance(make_sampler(fraction=0.5, blocks=True), BlockSampler)
+    assert isinstance(make_sampler(rows=10), ReservoirSampler)
+
+    with pytest.raises(ValueError):
+        make_sampler(fraction=0.5, rows=10)
+    with pytest.raises(ValueError):
+        make_sampler(rows=10, blocks=True)
@@ -0,0 +1,220 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+import random
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from script import storage as storage_module
+from script.processors import calculate_average_performance, group_by_position
+from script.reader import read_csv_files
+from script.reports import PerformanceReport
+from script.storage import SQLiteStore
+from script.cli import main
+
+
+CSV_CONTENT1 = """name,position,completed_tasks,performance,skills,team,experience_years
+Alex Ivanov,Backend Developer,45,4.8,"Python, Django",API Team,5
+Maria Petrova,Frontend Developer,38,4.7,"React, TypeScript",Web Team,4
+John Smith,Backend Developer,29,4.6,"Go, PostgreSQL",API Team,3"""
+
+CSV_CONTENT2 = """name,position,completed_tasks,performance,skills,team,experience_years
+Anna Lee,Frontend Developer,41,4.9,"Vue.js, JavaScript",Web Team,6
+Mike Brown,DevOps Engineer,36,4.7,"Docker, Kubernetes",Infra Team,7"""
+
+
+def create_test_csv(content: str) -> str:
+    """Создает временный CSV файл с заданным содержимым."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv',
+                                     delete=False, encoding='utf-8') as f:
+        f.write(content)
+        return f.name
+
+
+@pytest.fixture
+def csv_files():
+    files = [create_test_csv(CSV_CONTENT1), create_test_csv(CSV_CONTENT2)]
+    yield files
+    for file_path in files:
+        Path(file_path).unlink()
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield os.path.join(tmp_dir, 'dev.sqlite')
+
+
+def test_store_fetch_all_matches_csv(csv_files, db_path):
+    """Тест совпадения данных из базы с данными из CSV."""
+    with SQLiteStore(db_path) as store:
+        store.load(csv_files)
+        assert store.fetch_all(csv_files) == read_csv_files(csv_files)
+        assert store.fetch_all(csv_files[1:]) == read_csv_files(csv_files[1:])
+
+
+def test_store_fetch_columns(csv_files, db_path):
+    """Тест выборки только нужных столбцов из базы."""
+    columns = ('position', 'performance')
+    with SQLiteStore(db_path) as store:
+        store.load(csv_files)
+        assert store.fetch_all(csv_files, columns=columns) == \
+            read_csv_files(csv_files, columns=columns)
+
+
+def test_store_creates_indexes(db_path):
+    """Тест создания индексов по должности, команде и имени."""
+    with SQLiteStore(db_path) as store:
+        indexes = {row[0] for row in store.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )}
+    assert {'idx_developers_position', 'idx_developers_team',
+            'idx_developers_name'} <= indexes
+
+
+def test_store_incremental_load(csv_files, db_path):
+    """Тест перезагрузки только изменившихся файлов."""
+    with SQLiteStore(db_path) as store:
+        assert len(store.load(csv_files)) == 2
+        assert store.load(csv_files) == []
+
+        with open(csv_files[0], 'a', encoding='utf-8') as f:
+            f.write("\nKate Green,QA Engineer,20,4.1,Selenium,QA Team,2")
+
+        with patch.object(storage_module, 'read_csv_files',
+                          wraps=read_csv_files) as mock_read:
+            reloaded = store.load(csv_files)
+            mock_read.assert_called_once_with([reloaded[0]])
+
+        assert reloaded == [os.path.abspath(csv_files[0])]
+        assert store.fetch_all(csv_files) == read_csv_files(csv_files)
+
+
+def test_store_invalid_data_keeps_previous_state(csv_files, db_path):
+    """Тест сохранения прежних данных при ошибке в CSV."""
+    with SQLiteStore(db_path) as store:
+        store.load(csv_files)
+        with open(csv_files[1], 'a', encoding='utf-8') as f:
+            f.write("\nBad Row,QA Engineer,invalid,4.1,Selenium,QA Team,2")
+
+        with pytest.raises(ValueError, match="Неверный формат данных"):
+            store.load(csv_files)
+
+        assert len(store.fetch_all(csv_files)) == 5
+
+
+def test_performance_report_sql_matches_csv(csv_files, db_path):
+    """Тест совпадения отчета по эффективности на CSV и SQLite."""
+    report = PerformanceReport()
+    expected = report.generate(read_csv_files(csv_files))
+
+    with SQLiteStore(db_path) as store:
+        store.load(csv_files)
+        result = report.generate_from_store(store, csv_files)
+
+    assert result == expected
+
+
+def test_performance_report_sql_matches_csv_with_near_ties(db_path):
+    """Тест: близкие средние совпадают на CSV и SQLite вместе с порядком строк."""
+    file_path = create_test_csv(
+        "name,position,completed_tasks,performance,skills,team,experience_years\n"
+        "A1,A,10,0.1,Python,Team,1\n"
+        "B1,B,10,0.2,Python,Team,1\n"
+        "A2,A,10,0.2,Python,Team,1\n"
+        "B2,B,10,0.2,Python,Team,1\n"
+        "A3,A,10,0.3,Python,Team,1\n"
+        "B3,B,10,0.2,Python,Team,1"
+    )
+    report = PerformanceReport()
+    try:
+        expected = report.generate(read_csv_files([file_path]))
+        with SQLiteStore(db_path) as store:
+            store.load([file_path])
+            result = report.generate_from_store(store, [file_path])
+    finally:
+        Path(file_path).unlink()
+
+    assert result == expected
+
+
+def test_store_average_by_matches_fsum(db_path):
+    """Тест: среднее в SQL совпадает со средним по CSV без ошибки округления."""
+    rng = random.Random(1)
+    lines = ["name,position,completed_tasks,performance,skills,team,experience_years"]
+    for i in range(2000):
+        lines.append(f"Dev {i},Position {i % 200},10,{rng.uniform(0, 5):.3f},Python,Team,1")
+    file_path = create_test_csv("\n".join(lines))
+    try:
+        expected = dict(
+            (position, calculate_average_performance(developers))
+            for position, developers in group_by_position(read_csv_files([file_path])).items()
+        )
+        with SQLiteStore(db_path) as store:
+            store.load([file_path])
+            result = dict(store.average_by('position', 'performance', [file_path]))
+
+        assert result == expected
+    finally:
+        Path(file_path).unlink()
+
+
+def test_store_average_by_unknown_column(db_path):
+    """Тест защиты от неизвестных столбцов."""
+    with SQLiteStore(db_path) as store:
+        with pytest.raises(ValueError, match="Неизвестный столбец"):
+            store.average_by('position; DROP TABLE files', 'performance', [])
+
+
+def test_cli_with_db(capsys, monkeypatch, csv_files, db_path):
+    """Тест CLI с SQLite хранилищем."""
+    test_args = ['script.py', '--files'] + csv_files + \
+        ['--report', 'performance', '--db', db_path]
+    monkeypatch.setattr(sys, 'argv', test_args)
+    main()
+    captured = capsys.readouterr()
+
+    assert "Frontend Developer" in captured.out
+    assert "DevOps Engineer" in captured.out
+
+
+def test_performance_report_sql_with_filters(csv_files, db_path):
+    """Тест фильтров в SQLite хранилище."""
+    from script.filters import parse_filters
+
+    filters = parse_filters(['team=API Team', 'experience_years>=4'])
+    report = PerformanceReport()
+    expected = report.generate(read_csv_files(csv_files, filters))
+
+    with SQLiteStore(db_path) as store:
+        store.load(csv_files)
+        assert store.fetch_all(csv_files, filters) == read_csv_files(csv_files, filters)
+        result = report.generate_from_store(store, csv_files, filters)
+
+    assert result == expected == [('Backend Developer', 4.8)]
+
+
+def test_store_filter_unknown_column(csv_files, db_path):
+    """Тест фильтра по неизвестному столбцу в SQLite хранилище."""
+    from script.filters import FilterError, parse_filters
+
+    with SQLiteStore(db_path) as store:
+        store.load(csv_files)
+        with pytest.raises(FilterError, match="Неизвестный столбец фильтра: salary"):
+            store.fetch_all(csv_files, parse_filters(['salary>100']))
+
+
+def test_cli_filter_unknown_column_same_error(capsys, monkeypatch, csv_files, db_path):
+    """Тест CLI: одинаковая ошибка фильтра для CSV и SQLite."""
+    errors = []
+    for extra in ([], ['--db', db_path]):
+        test_args = ['script.py', '--files'] + csv_files + \
+            ['--report', 'performance', '--where', 'salary>100'] + extra
+        monkeypatch.setattr(sys, 'argv', test_args)
+        with pytest.raises(SystemExit) as e:
+            main()
+        assert e.value.code == 1
+        errors.append(capsys.readouterr().err)
+
+    assert errors[0] == errors[1] == "Ошибка: Неизвестный столбец фильтра: salary\n"